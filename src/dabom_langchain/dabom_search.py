@@ -1,12 +1,17 @@
 """Tool for the dabom search API."""
 
+import asyncio
+import warnings
 from typing import Dict, List, Optional, Type, Union
 
+import aiohttp
+import httpx
+
 from langchain_core.callbacks import (
     AsyncCallbackManagerForToolRun,
     CallbackManagerForToolRun,
 )
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from langchain_core.tools import BaseTool
 
 from .dabom_search_api_wrapper import DabomSearchAPIWrapper
@@ -64,6 +69,11 @@ class DabomSearchResults(BaseTool):
 
     """  # noqa: E501
 
+    model_config = ConfigDict(
+        # api_wrapper is a plain dataclass holding live client sessions.
+        arbitrary_types_allowed=True,
+    )
+
     name: str = "dabom_search_results_json"
     description: str = (
         "포괄적이고 정확하며 신뢰할 수 있는 결과를 위해 최적화된 검색 엔진입니다. "
@@ -81,13 +91,29 @@ class DabomSearchResults(BaseTool):
         query: str,
         run_manager: Optional[CallbackManagerForToolRun] = None,
     ) -> Union[List[Dict], str]:
-        """Use the tool."""
+        """Use the tool.
+
+        Prefer ``ainvoke`` from async code: this sync path performs a
+        blocking HTTP round-trip and will stall a running event loop.
+        """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            pass
+        else:
+            warnings.warn(
+                "DabomSearchResults was invoked synchronously inside a "
+                "running event loop; the HTTP round-trip will block the "
+                "loop. Use `ainvoke` instead.",
+                RuntimeWarning,
+                stacklevel=2,
+            )
         try:
             return self.api_wrapper.results(
                 query,
                 self.max_results,
             )
-        except Exception as e:
+        except httpx.HTTPError as e:
             return repr(e)
 
     async def _arun(
@@ -101,5 +127,5 @@ class DabomSearchResults(BaseTool):
                 query,
                 self.max_results,
             )
-        except Exception as e:
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
             return repr(e)
\ No newline at end of file
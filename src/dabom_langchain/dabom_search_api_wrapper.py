@@ -1,38 +1,199 @@
-import json
-from typing import Dict, List, Optional
+import asyncio
+import os
+import threading
+import time
+from typing import Any, Dict, Hashable, List, NamedTuple, Optional, Tuple, Union
 
 import aiohttp
-import requests
-from pydantic import BaseModel, ConfigDict, SecretStr, model_validator
-from langchain_core.utils import get_from_dict_or_env
+import httpx
+import orjson
+from dataclasses import dataclass, field
 
 DABOM_API_URL = "https://api.dabomai.com"
 
+# Transient failures (connection resets, 429/5xx) are retried on the same
+# pooled connection with exponential backoff instead of surfacing at once.
+_RETRY_ATTEMPTS = 3
+_RETRY_BACKOFF = 0.25
+_RETRY_STATUSES = frozenset({429, 502, 503, 504})
 
-class DabomSearchAPIWrapper(BaseModel):
+
+def _retry_delay(attempt: int, retry_after: Optional[str] = None) -> float:
+    """Backoff before retry ``attempt``, honoring a Retry-After header."""
+    if retry_after:
+        try:
+            return max(float(retry_after), 0.0)
+        except ValueError:
+            pass
+    return _RETRY_BACKOFF * (2**attempt)
+
+_client: Optional[httpx.Client] = None
+_client_lock = threading.Lock()
+
+
+def _get_client() -> httpx.Client:
+    """Return a shared HTTP/2-capable ``httpx.Client``.
+
+    Reusing one client keeps the TCP+TLS connection to the Dabom API
+    alive across calls instead of paying a full handshake per request,
+    and HTTP/2 lets concurrent callers multiplex over that connection.
+    """
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = httpx.Client(
+                    http2=True,
+                    timeout=httpx.Timeout(30.0, connect=3.0),
+                    limits=httpx.Limits(
+                        max_connections=32,
+                        max_keepalive_connections=16,
+                    ),
+                )
+    return _client
+
+
+class _TTLCache:
+    """A small thread-safe mapping whose entries expire after ``ttl`` seconds.
+
+    Oldest entries are evicted once ``maxsize`` is reached. This is enough
+    for memoizing search responses without pulling in a caching dependency.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 300.0) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._data: Dict[Hashable, Tuple[float, Any]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Any:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None and time.monotonic() - entry[0] < self.ttl:
+                self.hits += 1
+                return entry[1]
+            if entry is not None:
+                del self._data[key]
+            self.misses += 1
+            return None
+
+    def set(self, key: Hashable, value: Any) -> None:
+        with self._lock:
+            if key not in self._data and len(self._data) >= self.maxsize:
+                now = time.monotonic()
+                self._data = {
+                    k: v for k, v in self._data.items() if now - v[0] < self.ttl
+                }
+                while len(self._data) >= self.maxsize:
+                    del self._data[next(iter(self._data))]
+            self._data[key] = (time.monotonic(), value)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+def _cache_disabled() -> bool:
+    return bool(os.getenv("DABOM_NO_CACHE"))
+
+
+class UrlContent(NamedTuple):
+    """A single cleaned search result."""
+
+    url: str
+    content: str
+
+
+@dataclass(slots=True)
+class DabomSearchAPIWrapper:
     """Wrapper for Tavily Search API."""
 
-    dabom_api_key: SecretStr
+    dabom_api_key: str = field(default="", repr=False)
 
-    model_config = ConfigDict(
-        extra="forbid",
+    _headers: Dict[str, str] = field(init=False, repr=False)
+    _search_url: str = field(init=False, repr=False)
+    _sessions: Dict[int, aiohttp.ClientSession] = field(
+        init=False, repr=False, default_factory=dict
+    )
+    _cache: _TTLCache = field(init=False, repr=False, default_factory=_TTLCache)
+    _inflight: Dict[Tuple[str, Optional[int]], "asyncio.Future"] = field(
+        init=False, repr=False, default_factory=dict
     )
 
-    @model_validator(mode="before")
-    @classmethod
-    def validate_environment(cls, values: Dict) -> Dict:
-        """Validate that api key and endpoint exists in environment."""
-        dabom_api_key = get_from_dict_or_env(
-            values, "dabom_api_key", "DABOM_API_KEY"
-        )
-        values["dabom_api_key"] = dabom_api_key
-        return values
-
-    def _get_headers(self):
-        return {
-            "Authorization": f"Bearer {self.dabom_api_key.get_secret_value()}",
-            "Content-Type": "application/json"
+    def __post_init__(self) -> None:
+        if not self.dabom_api_key:
+            dabom_api_key = os.environ.get("DABOM_API_KEY")
+            if not dabom_api_key:
+                raise ValueError(
+                    "Did not find dabom_api_key, please add an environment "
+                    "variable `DABOM_API_KEY` which contains it, or pass "
+                    "`dabom_api_key` as a named parameter."
+                )
+            self.dabom_api_key = dabom_api_key
+        # The api key cannot change after construction, so build the header
+        # dict once instead of re-creating it on every request.
+        self._headers = {
+            "Authorization": f"Bearer {self.dabom_api_key}",
+            "Content-Type": "application/json",
+            "Accept-Encoding": "gzip, deflate, br",
         }
+        self._search_url = f"{DABOM_API_URL}/search"
+
+    async def _get_async_session(self) -> aiohttp.ClientSession:
+        """Return a shared ``aiohttp.ClientSession`` for the running loop.
+
+        One session (and its connection pool) is created lazily per event
+        loop and reused for all subsequent async calls, avoiding the cost
+        of a fresh connector, DNS lookup and TLS handshake per request.
+        """
+        loop_id = id(asyncio.get_running_loop())
+        session = self._sessions.get(loop_id)
+        if session is None or session.closed:
+            session = aiohttp.ClientSession(
+                headers=self._headers,
+                connector=aiohttp.TCPConnector(
+                    limit=100,
+                    ttl_dns_cache=300,
+                    keepalive_timeout=75,
+                ),
+                timeout=aiohttp.ClientTimeout(total=30),
+            )
+            self._sessions[loop_id] = session
+        return session
+
+    async def aclose(self) -> None:
+        """Close any ``aiohttp.ClientSession`` this wrapper has opened."""
+        for session in self._sessions.values():
+            if not session.closed:
+                await session.close()
+        self._sessions.clear()
+
+    def warmup(self) -> None:
+        """Open a connection to the API host ahead of the first query.
+
+        Calling this during application startup moves the TCP+TLS
+        handshake off the first user-visible search. Failures are
+        ignored; the first real request will simply connect cold.
+        """
+        try:
+            _get_client().head(DABOM_API_URL, timeout=2)
+        except httpx.HTTPError:
+            pass
+
+    async def warmup_async(self) -> None:
+        """Async counterpart of :meth:`warmup` for the shared session."""
+        try:
+            session = await self._get_async_session()
+            async with session.head(
+                DABOM_API_URL, timeout=aiohttp.ClientTimeout(total=2)
+            ):
+                pass
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            pass
 
     def raw_results(
         self,
@@ -45,14 +206,26 @@ class DabomSearchAPIWrapper(BaseModel):
             "max_results": max_results,
 
         }
-        response = requests.post(
-            # type: ignore
-            f"{DABOM_API_URL}/search",
-            json=params,
-            headers=self._get_headers(),
-        )
-        response.raise_for_status()
-        return response.json()
+        body = orjson.dumps(params)
+        for attempt in range(_RETRY_ATTEMPTS + 1):
+            try:
+                response = _get_client().post(
+                    self._search_url,
+                    content=body,
+                    headers=self._headers,
+                )
+            except httpx.TransportError:
+                if attempt == _RETRY_ATTEMPTS:
+                    raise
+                time.sleep(_retry_delay(attempt))
+                continue
+            if response.status_code in _RETRY_STATUSES and attempt < _RETRY_ATTEMPTS:
+                time.sleep(
+                    _retry_delay(attempt, response.headers.get("Retry-After"))
+                )
+                continue
+            response.raise_for_status()
+            return orjson.loads(response.content)
 
     def results(
         self,
@@ -75,12 +248,21 @@ class DabomSearchAPIWrapper(BaseModel):
                 content: The content of the result.
                 score: The score of the result.
         """
+        if _cache_disabled():
+            raw_search_results = self.raw_results(query, max_results=max_results)
+            return self.clean_results(raw_search_results["results"])
+        key = (query, max_results)
+        cached = self._cache.get(key)
+        if cached is not None:
+            return list(cached)
         raw_search_results = self.raw_results(
             query,
             max_results=max_results,
 
         )
-        return self.clean_results(raw_search_results["results"])
+        results = self.clean_results(raw_search_results["results"])
+        self._cache.set(key, results)
+        return list(results)
 
     async def raw_results_async(
         self,
@@ -90,23 +272,30 @@ class DabomSearchAPIWrapper(BaseModel):
     ) -> Dict:
         """Get results from the Dabom Search API asynchronously."""
 
-        # Function to perform the API call
-        async def fetch() -> str:
-            params = {
-                "api_key": self.dabom_api_key.get_secret_value(),
-                "query": query,
-                "max_results": max_results,
-            }
-            async with aiohttp.ClientSession(headers=self._get_headers()) as session:
-                async with session.post(f"{DABOM_API_URL}/search", json=params) as res:
-                    if res.status == 200:
-                        data = await res.text()
-                        return data
+        params = {
+            "query": query,
+            "max_results": max_results,
+        }
+        body = orjson.dumps(params)
+        session = await self._get_async_session()
+        for attempt in range(_RETRY_ATTEMPTS + 1):
+            try:
+                async with session.post(self._search_url, data=body) as res:
+                    if res.status in _RETRY_STATUSES and attempt < _RETRY_ATTEMPTS:
+                        delay = _retry_delay(
+                            attempt, res.headers.get("Retry-After")
+                        )
                     else:
-                        raise Exception(f"Error {res.status}: {res.reason}")
-
-        results_json_str = await fetch()
-        return json.loads(results_json_str)
+                        res.raise_for_status()
+                        # orjson parses bytes directly, skipping the
+                        # bytes->str decode that res.json()/res.text()
+                        # would perform on large payloads.
+                        return orjson.loads(await res.read())
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError):
+                if attempt == _RETRY_ATTEMPTS:
+                    raise
+                delay = _retry_delay(attempt)
+            await asyncio.sleep(delay)
 
     async def results_async(
         self,
@@ -114,20 +303,94 @@ class DabomSearchAPIWrapper(BaseModel):
         max_results: Optional[int] = 5,
 
     ) -> List[Dict]:
-        results_json = await self.raw_results_async(
-            query=query,
-            max_results=max_results,
-        )
-        return self.clean_results(results_json["results"])
-
-    def clean_results(self, results: List[Dict]) -> List[Dict]:
-        """Clean results from Tavily Search API."""
-        clean_results = []
-        for result in results:
-            clean_results.append(
-                {
-                    "url": result["url"],
-                    "content": result["content"],
-                }
+        if _cache_disabled():
+            results_json = await self.raw_results_async(
+                query=query, max_results=max_results
+            )
+            return self.clean_results(results_json["results"])
+        key = (query, max_results)
+        cached = self._cache.get(key)
+        if cached is not None:
+            return list(cached)
+        # Single-flight: concurrent identical queries await the first
+        # request's future instead of hitting the API again.
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            return list(await asyncio.shield(inflight))
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            results_json = await self.raw_results_async(
+                query=query,
+                max_results=max_results,
             )
-        return clean_results
+            results = self.clean_results(results_json["results"])
+        except BaseException as exc:
+            future.set_exception(exc)
+            future.exception()  # mark retrieved for futures nobody awaits
+            raise
+        else:
+            future.set_result(results)
+            self._cache.set(key, results)
+            return list(results)
+        finally:
+            self._inflight.pop(key, None)
+
+    def cache_info(self) -> Dict[str, int]:
+        """Return hit/miss/size counters for the response cache."""
+        return {
+            "hits": self._cache.hits,
+            "misses": self._cache.misses,
+            "size": len(self._cache._data),
+            "maxsize": self._cache.maxsize,
+        }
+
+    async def results_batch_async(
+        self,
+        queries: List[str],
+        max_results: Optional[int] = 5,
+        concurrency: int = 8,
+    ) -> List[object]:
+        """Run several queries concurrently over the shared session.
+
+        Args:
+            queries: The queries to search for.
+            max_results: The maximum number of results to return per query.
+            concurrency: The maximum number of in-flight requests.
+
+        Returns:
+            A list with one entry per query, in order: either the cleaned
+            results for that query or the exception it raised.
+        """
+        sem = asyncio.Semaphore(concurrency)
+
+        async def one(query: str) -> List[Dict]:
+            async with sem:
+                return await self.results_async(query, max_results=max_results)
+
+        return await asyncio.gather(
+            *(one(query) for query in queries), return_exceptions=True
+        )
+
+    def clean_results(
+        self, results: List[Dict], as_tuples: bool = False
+    ) -> Union[List[Dict], List[UrlContent]]:
+        """Clean results from Tavily Search API.
+
+        Args:
+            results: The raw result dicts from the API.
+            as_tuples: Return ``UrlContent`` named tuples instead of dicts.
+                Tuples are smaller and faster to iterate, but the tool
+                contract expects dicts, so they are opt-in.
+        """
+        if as_tuples:
+            return [
+                UrlContent(result["url"], result["content"]) for result in results
+            ]
+        return [
+            {
+                "url": result["url"],
+                "content": result["content"],
+            }
+            for result in results
+        ]